@@ -3,10 +3,12 @@
 import sys
 
 from src.db import test_connection
+from src.profiling import enable_profiling, profile_phase
 from src.scrapers.immigration import scrape_and_save as scrape_immigration
 from src.scrapers.tech import scrape_and_save as scrape_tech
 from src.scrapers.finance import scrape_and_save as scrape_finance
 from src.mailer import send_daily_briefs
+from src.maintenance import archive_old_news, restore_archive
 
 
 def run_scrapers() -> None:
@@ -42,29 +44,74 @@ def run_mailer() -> None:
         print(f"Mailer failed: {e}")
 
 
-def main(mode: str = "all") -> None:
+def run_maintenance() -> None:
+    """Archive and delete news items older than the retention period."""
+    print("\n--- Running Maintenance ---")
+    try:
+        result = archive_old_news()
+        print(f"Result: {result}")
+    except Exception as e:
+        print(f"Maintenance failed: {e}")
+
+
+def run_restore(path: str) -> None:
+    """Load archived news items back into the database."""
+    print("\n--- Restoring Archive ---")
+    try:
+        restore_archive(path)
+    except Exception as e:
+        print(f"Restore failed: {e}")
+
+
+def main(mode: str = "all", profile: bool = False, restore_path: str | None = None) -> None:
     """Main entry point.
 
     Args:
-        mode: 'scrape' for scrapers only, 'mail' for mailer only, 'all' for both.
+        mode: 'scrape' for scrapers only, 'mail' for mailer only, 'all' for both,
+            'maintain' to archive old news items, 'restore' to load an archive back.
+        profile: Write per-phase profiling reports (also enabled by ALFRED_PROFILE=1).
+        restore_path: Archive file or directory to load in 'restore' mode.
     """
     print("Alfred is listening...")
 
+    if profile:
+        enable_profiling()
+
     try:
-        test_connection()
+        with profile_phase("connect"):
+            test_connection()
         print("Database connection successful.")
     except Exception as e:
         print(f"Database connection failed: {e}")
         return
 
     if mode in ("scrape", "all"):
-        run_scrapers()
+        with profile_phase("scrape"):
+            run_scrapers()
 
     if mode in ("mail", "all"):
-        run_mailer()
+        with profile_phase("mail"):
+            run_mailer()
+
+    if mode == "maintain":
+        with profile_phase("maintain"):
+            run_maintenance()
+
+    if mode == "restore":
+        if not restore_path:
+            print("Restore mode requires an archive path: python main.py restore <path>")
+            return
+        with profile_phase("restore"):
+            run_restore(restore_path)
 
 
 if __name__ == "__main__":
-    # Parse mode from command line: python main.py [scrape|mail|all]
-    run_mode = sys.argv[1] if len(sys.argv) > 1 else "all"
-    main(run_mode)
+    # Parse mode from command line:
+    #   python main.py [scrape|mail|all|maintain] [--profile]
+    #   python main.py restore <archive-file-or-dir>
+    args = sys.argv[1:]
+    profile_flag = "--profile" in args
+    positional = [arg for arg in args if not arg.startswith("--")]
+    run_mode = positional[0] if positional else "all"
+    archive_path = positional[1] if len(positional) > 1 else None
+    main(run_mode, profile=profile_flag, restore_path=archive_path)
@@ -8,6 +8,14 @@ load_dotenv()
 SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
 SUPABASE_KEY: str = os.getenv("SUPABASE_KEY", "")
 
+# Profiling (opt-in): set ALFRED_PROFILE=1 or pass --profile to main.py
+PROFILE_ENABLED: bool = os.getenv("ALFRED_PROFILE", "").lower() in ("1", "true", "yes")
+PROFILE_DIR: str = os.getenv("ALFRED_PROFILE_DIR", "profiles")
+
+# Retention: news_items older than this are archived and removed by `main.py maintain`
+NEWS_RETENTION_DAYS: int = int(os.getenv("NEWS_RETENTION_DAYS", "30"))
+ARCHIVE_DIR: str = os.getenv("ARCHIVE_DIR", "archives")
+
 
 def validate_config() -> bool:
     """Validate that required environment variables are set."""
@@ -0,0 +1,89 @@
+"""Post-render optimization for email payloads (HTML minification and size reporting)."""
+
+import re
+
+# Keep lines well under the SMTP limit of 998 characters (RFC 5321)
+MAX_LINE_LENGTH = 500
+
+# Plain comments only - conditional comments (<!--[if mso]>) are kept for Outlook
+_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_STYLE_ATTR_RE = re.compile(r'style="([^"]*)"')
+_WHITESPACE_RE = re.compile(r"\s+")
+_BETWEEN_TAGS_RE = re.compile(r">\s+<")
+_TAG_BOUNDARY_RE = re.compile(r"(?<=>)(?=<)")
+
+
+def compact_style(declarations: str) -> str:
+    """Compact an inline style declaration list.
+
+    Example: 'margin: 0; padding: 0;' -> 'margin:0;padding:0'
+    """
+    parts = []
+    for declaration in declarations.split(";"):
+        prop, sep, value = declaration.partition(":")
+        if not sep:
+            continue
+        parts.append(f"{prop.strip()}:{value.strip()}")
+    return ";".join(parts)
+
+
+def wrap_lines(html: str, max_length: int = MAX_LINE_LENGTH) -> str:
+    """Break minified HTML at tag boundaries so no line exceeds max_length (where possible)."""
+    lines: list[str] = []
+    current = ""
+    for chunk in _TAG_BOUNDARY_RE.split(html):
+        if current and len(current) + len(chunk) > max_length:
+            lines.append(current)
+            current = ""
+        current += chunk
+    if current:
+        lines.append(current)
+    return "\n".join(lines)
+
+
+def minify_html(html: str) -> str:
+    """Shrink rendered email HTML without changing how it displays.
+
+    Strips comments, compacts inline styles and collapses whitespace. Inline
+    styles are kept on every element: several clients ignore <style> blocks,
+    so repeated styles cannot safely be hoisted into shared classes.
+
+    Args:
+        html: Rendered HTML email body.
+
+    Returns:
+        Minified HTML, wrapped to SMTP-safe line lengths.
+    """
+    html = _COMMENT_RE.sub("", html)
+    html = _STYLE_ATTR_RE.sub(lambda m: f'style="{compact_style(m.group(1))}"', html)
+    html = _WHITESPACE_RE.sub(" ", html)
+    html = _BETWEEN_TAGS_RE.sub("><", html)
+    return wrap_lines(html.strip())
+
+
+def payload_bytes(html: str, text: str = "") -> int:
+    """Return the UTF-8 size of an email's HTML and plain-text parts."""
+    return len(html.encode("utf-8")) + len(text.encode("utf-8"))
+
+
+def format_size_report(label: str, before: str, after: str, text: str = "") -> str:
+    """Describe the per-email byte savings of an optimized payload.
+
+    The "after" figure counts every part that is sent (HTML plus text).
+
+    Args:
+        label: Name of the digest variant.
+        before: Original HTML (previously the only part sent).
+        after: Optimized HTML.
+        text: Plain-text alternative sent alongside the HTML.
+
+    Returns:
+        Human-readable one-line report.
+    """
+    before_bytes = payload_bytes(before)
+    after_bytes = payload_bytes(after, text)
+    saved = 100 * (before_bytes - after_bytes) / before_bytes if before_bytes else 0.0
+    return (
+        f"{label}: {before_bytes:,} B -> {after_bytes:,} B per email ({saved:.0f}% smaller; "
+        f"html {payload_bytes(after):,} B + text {payload_bytes(text):,} B)"
+    )
@@ -6,8 +6,11 @@ from typing import Any
 
 import resend
 from dotenv import load_dotenv
+from postgrest.exceptions import APIError
+from supabase import Client
 
 from src.db import get_client
+from src.email_payload import format_size_report, minify_html, payload_bytes
 
 load_dotenv()
 
@@ -17,6 +20,12 @@ APP_BASE_URL: str = os.getenv("APP_BASE_URL", "http://localhost:3000")
 # Valid category keys (must match preferences_json keys)
 VALID_CATEGORIES = ("immigration", "tech", "finance")
 
+# PostgREST error code for "function not found in the schema cache"
+FUNCTION_NOT_FOUND_CODE = "PGRST202"
+
+# Stands in for the subscriber's token while a digest variant is rendered once and reused
+TOKEN_PLACEHOLDER = "__MANAGEMENT_TOKEN__"
+
 
 def validate_resend_config() -> bool:
     """Validate that Resend API key is set."""
@@ -222,6 +231,58 @@ def generate_html_digest(
 """
 
 
+def generate_text_digest(
+    news_items: list[dict[str, Any]], management_token: str | None = None
+) -> str:
+    """Generate the plain-text alternative matching generate_html_digest.
+
+    Args:
+        news_items: List of news item dicts to include in the digest.
+        management_token: Optional token for the preferences link.
+
+    Returns:
+        Plain-text email body.
+    """
+    lines = ["THE ALFRED BRIEF", "Your Daily Intelligence Digest", ""]
+
+    if not news_items:
+        lines.append("No new intelligence items today. Check back tomorrow.")
+    else:
+        lines += ["Good morning. Your briefing is ready.", ""]
+        for item in news_items:
+            category = item.get("category", "Unknown").upper()
+            formatted_date = format_scraped_date(item.get("scraped_at", ""))
+            lines.append(f"[{category}] {formatted_date}".rstrip())
+            lines.append(item.get("title", "Untitled"))
+            lines.append(item.get("url", "#"))
+            lines.append("")
+
+    lines.append("---")
+    if management_token:
+        lines.append(f"Manage preferences: {APP_BASE_URL}/preferences?token={management_token}")
+    lines.append("The Alfred Brief - Delivered with precision.")
+    return "\n".join(lines) + "\n"
+
+
+def build_digest_variant(
+    news_items: list[dict[str, Any]], has_token: bool
+) -> tuple[str, str, str]:
+    """Render, minify and text-render a digest once for every subscriber who shares it.
+
+    The management token is left as TOKEN_PLACEHOLDER for the caller to fill in.
+
+    Args:
+        news_items: News items for this variant.
+        has_token: Whether to include the preferences link.
+
+    Returns:
+        Tuple of (original_html, optimized_html, text).
+    """
+    token = TOKEN_PLACEHOLDER if has_token else None
+    original_html = generate_html_digest(news_items, token)
+    return original_html, minify_html(original_html), generate_text_digest(news_items, token)
+
+
 def get_subscriber_categories(preferences_json: dict[str, Any] | None) -> set[str]:
     """Extract enabled categories from subscriber preferences.
 
@@ -260,17 +321,86 @@ def filter_news_for_subscriber(
     ]
 
 
+def build_cohorts_locally(
+    client: Client, news_categories: set[str]
+) -> list[dict[str, Any]]:
+    """Group active subscribers into cohorts in Python.
+
+    Fallback for databases without the get_daily_brief_cohorts function
+    (terraform/migrations/04_subscriber_cohorts.sql). Returns the same shape.
+
+    Args:
+        client: Supabase client.
+        news_categories: Categories that have news today.
+
+    Returns:
+        List of {"categories": [...], "subscribers": [{id, email, management_token}]}.
+    """
+    subscribers_response = (
+        client.table("subscribers")
+        .select("id, email, preferences_json, management_token")
+        .eq("is_active", True)
+        .execute()
+    )
+
+    cohorts: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for subscriber in subscribers_response.data:
+        matched = get_subscriber_categories(subscriber.get("preferences_json")) & news_categories
+        if not matched:
+            continue
+        cohorts.setdefault(tuple(sorted(matched)), []).append(
+            {
+                "id": subscriber.get("id"),
+                "email": subscriber.get("email"),
+                "management_token": subscriber.get("management_token"),
+            }
+        )
+
+    return [
+        {"categories": list(categories), "subscribers": members}
+        for categories, members in cohorts.items()
+    ]
+
+
+def fetch_subscriber_cohorts(
+    client: Client, since: datetime, news_categories: set[str]
+) -> list[dict[str, Any]]:
+    """Fetch subscribers with matching news, grouped by their matched categories.
+
+    Matching runs in Postgres (get_daily_brief_cohorts), so only actual
+    recipients are transferred. Falls back to build_cohorts_locally only if
+    the function has not been deployed (PostgREST error PGRST202).
+
+    Args:
+        client: Supabase client.
+        since: Start of the news window.
+        news_categories: Categories that have news since `since`.
+
+    Returns:
+        List of {"categories": [...], "subscribers": [{id, email, management_token}]}.
+    """
+    try:
+        response = client.rpc("get_daily_brief_cohorts", {"since": since.isoformat()}).execute()
+        return response.data or []
+    except APIError as e:
+        # Only a missing function falls back; timeouts, 5xx and permission errors propagate
+        if e.code != FUNCTION_NOT_FOUND_CODE:
+            raise
+        print(f"Cohort function not deployed ({e.message}). Matching subscribers in Python.")
+        return build_cohorts_locally(client, news_categories)
+
+
 def send_daily_briefs() -> dict[str, Any]:
     """Send personalized daily briefs to all active subscribers.
 
     Logic:
-        1. Fetch all active subscribers.
+        1. Count active subscribers.
         2. Fetch today's news items.
-        3. For each subscriber:
-           - Parse their preferences.
-           - Filter news to their categories.
-           - If no matches, skip (don't spam).
-           - If matches exist, generate HTML and send.
+        3. Fetch subscriber cohorts: subscribers with at least one enabled
+           category that has news today, grouped by those categories.
+           Subscribers with no matches are never fetched (don't spam).
+        4. For each cohort, render the digest once (minified HTML plus
+           plain text) and send it to every member with their own token.
 
     Returns:
         Summary dict with sent_count, skipped_count, and errors.
@@ -280,17 +410,18 @@ def send_daily_briefs() -> dict[str, Any]:
 
     client = get_client()
 
-    # Fetch all active subscribers (including management_token for preferences link)
-    subscribers_response = (
+    # Count active subscribers (only the count is transferred)
+    count_response = (
         client.table("subscribers")
-        .select("id, email, preferences_json, management_token")
+        .select("id", count="exact")
         .eq("is_active", True)
+        .limit(1)
         .execute()
     )
-    subscribers = subscribers_response.data
-    print(f"Found {len(subscribers)} active subscribers.")
+    active_count = count_response.count or 0
+    print(f"Found {active_count} active subscribers.")
 
-    if not subscribers:
+    if not active_count:
         print("No active subscribers. Skipping email dispatch.")
         return {"sent_count": 0, "skipped_count": 0, "errors": []}
 
@@ -310,52 +441,71 @@ def send_daily_briefs() -> dict[str, Any]:
 
     if not all_news_items:
         print("No news items today. Skipping email dispatch.")
-        return {"sent_count": 0, "skipped_count": len(subscribers), "errors": []}
+        return {"sent_count": 0, "skipped_count": active_count, "errors": []}
+
+    news_categories = {item.get("category", "").lower() for item in all_news_items}
+    cohorts = fetch_subscriber_cohorts(client, today_start, news_categories)
+    recipient_count = sum(len(cohort["subscribers"]) for cohort in cohorts)
+    print(f"Found {recipient_count} subscribers with matching news in {len(cohorts)} cohorts.")
 
     sent_count = 0
-    skipped_count = 0
+    skipped_count = active_count - recipient_count
     errors: list[str] = []
-
-    for subscriber in subscribers:
-        email = subscriber.get("email")
-        preferences = subscriber.get("preferences_json")
-        management_token = subscriber.get("management_token")
-
-        if not email:
-            continue
-
-        # Get enabled categories for this subscriber
-        enabled_categories = get_subscriber_categories(preferences)
-
-        if not enabled_categories:
-            print(f"  Skipping {email}: No categories enabled.")
-            skipped_count += 1
-            continue
-
-        # Filter news to subscriber's preferences
-        personalized_news = filter_news_for_subscriber(all_news_items, enabled_categories)
-
-        if not personalized_news:
-            print(f"  Skipping {email}: No matching news for their preferences.")
-            skipped_count += 1
-            continue
-
-        # Generate and send personalized email
-        try:
-            html_content = generate_html_digest(personalized_news, management_token)
-            params: resend.Emails.SendParams = {
-                "from": "Alfred <onboarding@resend.dev>",
-                "to": [email],
-                "subject": "Your Daily Brief from Alfred",
-                "html": html_content,
-            }
-            resend.Emails.send(params)
-            print(f"  Sent to {email}: {len(personalized_news)} items.")
-            sent_count += 1
-        except Exception as e:
-            error_msg = f"Failed to send to {email}: {e}"
-            print(f"  {error_msg}")
-            errors.append(error_msg)
-
+    bytes_before = 0
+    bytes_after = 0
+
+    for cohort in cohorts:
+        categories = set(cohort["categories"])
+        personalized_news = filter_news_for_subscriber(all_news_items, categories)
+        label = "+".join(sorted(categories))
+
+        # Render each digest variant once, then fill in the subscriber's token
+        variants: dict[bool, tuple[str, str, str]] = {}
+
+        for subscriber in cohort["subscribers"]:
+            email = subscriber.get("email")
+            management_token = subscriber.get("management_token")
+
+            if not email:
+                continue
+
+            has_token = bool(management_token)
+            is_new_variant = has_token not in variants
+            if is_new_variant:
+                variants[has_token] = build_digest_variant(personalized_news, has_token)
+            original_html, optimized_html, text_template = variants[has_token]
+
+            # Sizes are measured on what is actually sent (token substituted)
+            token = str(management_token)
+            html_content = optimized_html.replace(TOKEN_PLACEHOLDER, token)
+            text_content = text_template.replace(TOKEN_PLACEHOLDER, token)
+            original_content = original_html.replace(TOKEN_PLACEHOLDER, token)
+            if is_new_variant:
+                print(f"  Variant {format_size_report(label, original_content, html_content, text_content)}")
+
+            # Send personalized email
+            try:
+                params: resend.Emails.SendParams = {
+                    "from": "Alfred <onboarding@resend.dev>",
+                    "to": [email],
+                    "subject": "Your Daily Brief from Alfred",
+                    "html": html_content,
+                    "text": text_content,
+                }
+                resend.Emails.send(params)
+                print(f"  Sent to {email}: {len(personalized_news)} items.")
+                sent_count += 1
+                bytes_before += payload_bytes(original_content)
+                bytes_after += payload_bytes(html_content, text_content)
+            except Exception as e:
+                error_msg = f"Failed to send to {email}: {e}"
+                print(f"  {error_msg}")
+                errors.append(error_msg)
+
+    if sent_count:
+        print(
+            f"\nBytes per email: {bytes_before // sent_count:,} B before (html only), "
+            f"{bytes_after // sent_count:,} B after optimization (html + text)."
+        )
     print(f"\nDaily briefs complete: {sent_count} sent, {skipped_count} skipped, {len(errors)} errors.")
     return {"sent_count": sent_count, "skipped_count": skipped_count, "errors": errors}
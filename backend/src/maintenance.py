@@ -0,0 +1,175 @@
+"""Maintenance module for The Alfred Brief - news_items retention and archival."""
+
+import gzip
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from src.config import ARCHIVE_DIR, NEWS_RETENTION_DAYS
+from src.db import get_client
+
+# Rows fetched, archived and deleted per round trip. Deletes filter on ids in the
+# query string (~37 bytes per UUID), so this keeps URLs well under gateway limits.
+BATCH_SIZE = 100
+
+# Scrapers for these categories upsert onto fixed URLs (the Gov.uk pages, the
+# finance reference URL), so their row count is already bounded. Deleting them
+# would only make the next scrape reinsert them as new and mail them again.
+STABLE_URL_CATEGORIES = ("immigration", "finance")
+
+# Archives are partitioned by scrape date: <ARCHIVE_DIR>/news_items/YYYY-MM-DD.jsonl.gz
+ARCHIVE_TABLE = "news_items"
+
+
+def get_partition_path(scraped_at: str, archive_dir: str = ARCHIVE_DIR) -> Path:
+    """Return the archive file for a row based on its scrape date.
+
+    Args:
+        scraped_at: ISO format timestamp string.
+        archive_dir: Root archive directory.
+
+    Returns:
+        Path to the date-partitioned JSONL.gz file.
+    """
+    partition = scraped_at[:10] if scraped_at else "unknown"
+    return Path(archive_dir) / ARCHIVE_TABLE / f"{partition}.jsonl.gz"
+
+
+def write_archive_batch(rows: list[dict[str, Any]], archive_dir: str = ARCHIVE_DIR) -> int:
+    """Append rows to their date-partitioned archive files.
+
+    Each call appends a new gzip member, which gzip readers treat as one stream.
+
+    Args:
+        rows: news_items rows to archive.
+        archive_dir: Root archive directory.
+
+    Returns:
+        Number of rows written.
+    """
+    partitions: dict[Path, list[dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        partitions[get_partition_path(row.get("scraped_at", ""), archive_dir)].append(row)
+
+    for path, partition_rows in partitions.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "at", encoding="utf-8") as f:
+            for row in partition_rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    return len(rows)
+
+
+def read_archive(path: Path) -> list[dict[str, Any]]:
+    """Read all rows from a JSONL.gz archive file."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def archive_old_news(
+    retention_days: int = NEWS_RETENTION_DAYS, archive_dir: str = ARCHIVE_DIR
+) -> dict[str, Any]:
+    """Archive news_items older than the retention period, then delete them.
+
+    Rows are processed in batches: each batch is written and flushed to disk
+    before it is deleted, so an interrupted run never loses data (at worst a
+    batch is archived twice, which restore_archive tolerates). Categories in
+    STABLE_URL_CATEGORIES are left in place.
+
+    Args:
+        retention_days: Rows scraped more than this many days ago are archived.
+        archive_dir: Root archive directory.
+
+    Returns:
+        Summary dict with archived_count, deleted_count and cutoff.
+    """
+    cutoff = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    ) - timedelta(days=retention_days)
+    print(f"Archiving news_items scraped before {cutoff.date()} to {archive_dir}/")
+
+    client = get_client()
+    archived_count = 0
+    deleted_count = 0
+
+    while True:
+        # Always read the first page: the previous batch has been deleted
+        response = (
+            client.table("news_items")
+            .select("*")
+            .lt("scraped_at", cutoff.isoformat())
+            .not_.in_("category", list(STABLE_URL_CATEGORIES))
+            .order("scraped_at")
+            .limit(BATCH_SIZE)
+            .execute()
+        )
+        rows = response.data
+        if not rows:
+            break
+
+        archived_count += write_archive_batch(rows, archive_dir)
+
+        ids = [row["id"] for row in rows]
+        delete_response = client.table("news_items").delete().in_("id", ids).execute()
+        batch_deleted = len(delete_response.data)
+        deleted_count += batch_deleted
+        print(
+            f"  Archived {len(rows)} and deleted {batch_deleted} rows "
+            f"(through {rows[-1].get('scraped_at', '')[:10]})."
+        )
+
+        # Nothing deleted (e.g. blocked by RLS): the same rows would be read forever
+        if batch_deleted == 0:
+            print("  Delete removed no rows. Stopping to avoid re-archiving the same batch.")
+            break
+
+        if len(rows) < BATCH_SIZE:
+            break
+
+    print(f"Maintenance complete: {archived_count} archived, {deleted_count} deleted.")
+    return {
+        "archived_count": archived_count,
+        "deleted_count": deleted_count,
+        "cutoff": cutoff.isoformat(),
+    }
+
+
+def restore_archive(path: str) -> int:
+    """Load archived rows back into news_items for backfills.
+
+    Rows whose URL already exists in news_items are skipped, so a backfill
+    never replaces a live row with an older copy.
+
+    Args:
+        path: A single .jsonl.gz archive file, or a directory to restore recursively.
+
+    Returns:
+        Number of rows restored.
+    """
+    target = Path(path)
+    files = sorted(target.rglob("*.jsonl.gz")) if target.is_dir() else [target]
+    if not files:
+        print(f"No archive files found at {path}.")
+        return 0
+
+    client = get_client()
+    restored_count = 0
+
+    for file in files:
+        # Dedupe by URL: a batch archived twice must not hit the same row twice in one upsert
+        rows = list({row["url"]: row for row in read_archive(file)}.values())
+        # Insert based on URL (unique constraint) - live rows are never overwritten
+        file_restored = 0
+        for start in range(0, len(rows), BATCH_SIZE):
+            batch = rows[start : start + BATCH_SIZE]
+            response = client.table("news_items").upsert(
+                batch, on_conflict="url", ignore_duplicates=True
+            ).execute()
+            file_restored += len(response.data)
+        restored_count += file_restored
+        print(f"  Restored {file_restored} of {len(rows)} rows from {file} (others already present).")
+
+    print(f"Restore complete: {restored_count} rows.")
+    return restored_count
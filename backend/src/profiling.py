@@ -0,0 +1,167 @@
+"""Opt-in profiling hooks for The Alfred Brief daily run.
+
+Each phase of the run (connection check, scrapers, mailer) can be wrapped in
+``profile_phase``. When profiling is enabled, the phase is recorded with
+cProfile (calling thread), tracemalloc and a stack sampler (all threads), and
+the following artifacts are written to the profile directory:
+
+    <phase>.prof       - raw cProfile data (load with pstats / snakeviz)
+    <phase>.txt        - top functions by cumulative time
+    <phase>.alloc.txt  - top allocation sites by size
+    <phase>.collapsed  - sampled stacks in collapsed format (flamegraph.pl / speedscope)
+
+When profiling is disabled the context manager is a no-op.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Iterator
+
+from src.config import PROFILE_DIR, PROFILE_ENABLED
+
+# Seconds between stack samples for the collapsed-stack output
+SAMPLE_INTERVAL = 0.005
+
+# Number of rows to include in the text reports
+TOP_N = 30
+
+_enabled: bool = PROFILE_ENABLED
+
+
+def enable_profiling() -> None:
+    """Turn on profiling for the rest of the process (e.g. from a CLI flag)."""
+    global _enabled
+    _enabled = True
+
+
+def is_profiling_enabled() -> bool:
+    """Return True if phases should be profiled."""
+    return _enabled
+
+
+def _format_frame(frame: FrameType) -> str:
+    """Format a frame as 'module:function' for collapsed stacks."""
+    code = frame.f_code
+    return f"{Path(code.co_filename).stem}:{code.co_name}"
+
+
+class StackSampler:
+    """Periodically sample the call stacks of every thread in the process.
+
+    Produces counts keyed by semicolon-joined stacks (root first), which is the
+    "collapsed" format understood by flamegraph.pl and speedscope. Each stack is
+    rooted at its thread name, so work done in worker threads (e.g. the
+    crawler's thread pool) shows up alongside the main thread.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="alfred-sampler", daemon=True)
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the background thread to exit."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        sampler_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_id:
+                    continue
+                stack: list[str] = []
+                current: FrameType | None = frame
+                while current is not None:
+                    stack.append(_format_frame(current))
+                    current = current.f_back
+                stack.append(names.get(thread_id, f"thread-{thread_id}"))
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        """Write sampled stacks in collapsed format."""
+        lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        path.write_text("\n".join(lines) + "\n" if lines else "")
+
+
+def _write_reports(
+    name: str,
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    sampler: StackSampler,
+    elapsed: float,
+    peak_bytes: int,
+) -> None:
+    """Write all per-phase artifacts to the profile directory."""
+    out_dir = Path(PROFILE_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    profiler.dump_stats(out_dir / f"{name}.prof")
+
+    stream = io.StringIO()
+    stream.write(f"Phase: {name}\nWall time: {elapsed:.3f}s\n\n")
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(TOP_N)
+    (out_dir / f"{name}.txt").write_text(stream.getvalue())
+
+    alloc_lines = [f"Phase: {name}", f"Peak traced memory: {peak_bytes / 1024:.1f} KiB", ""]
+    for stat in snapshot.statistics("lineno")[:TOP_N]:
+        alloc_lines.append(str(stat))
+    (out_dir / f"{name}.alloc.txt").write_text("\n".join(alloc_lines) + "\n")
+
+    sampler.write_collapsed(out_dir / f"{name}.collapsed")
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """Profile a phase of the daily run if profiling is enabled.
+
+    Args:
+        name: Phase name, used as the artifact file prefix.
+    """
+    if not _enabled:
+        yield
+        return
+
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    sampler = StackSampler()
+    profiler = cProfile.Profile()
+
+    start = time.perf_counter()
+    sampler.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        sampler.stop()
+        elapsed = time.perf_counter() - start
+
+        snapshot = tracemalloc.take_snapshot()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+        try:
+            _write_reports(name, profiler, snapshot, sampler, elapsed, peak_bytes)
+            print(f"[profile] {name}: {elapsed:.3f}s, peak {peak_bytes / 1024:.1f} KiB -> {PROFILE_DIR}/")
+        except OSError as e:
+            print(f"[profile] Failed to write reports for {name}: {e}")
@@ -0,0 +1,166 @@
+"""Bounded, polite concurrent crawler shared by the scrapers."""
+
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+USER_AGENT = "TheAlfredBrief/0.1 (+https://github.com/ahmadAlMezaal/the-alfred-brief)"
+
+# Defaults tuned for a handful of pages on a single well-provisioned host (gov.uk)
+MAX_WORKERS = 8
+PER_HOST_LIMIT = 4
+POLITENESS_DELAY = 0.25  # Minimum seconds between request starts to the same host
+MAX_DEPTH = 1
+REQUEST_TIMEOUT = 30
+
+# Given (page_url, html), return the links on that page worth following
+LinkExtractor = Callable[[str, str], list[str]]
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for deduplication (drops the #fragment)."""
+    return urldefrag(url)[0]
+
+
+class Crawler:
+    """Fetch pages concurrently with per-host limits, robots.txt and a depth cap.
+
+    Pages are fetched level by level: all seeds first (depth 0), then any
+    new links found on them (depth 1), up to ``max_depth``. Each level runs in
+    parallel, so it completes in roughly the time of its slowest page.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        per_host_limit: int = PER_HOST_LIMIT,
+        delay: float = POLITENESS_DELAY,
+        max_depth: int = MAX_DEPTH,
+        timeout: int = REQUEST_TIMEOUT,
+    ) -> None:
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.delay = delay
+        self.max_depth = max_depth
+        self.timeout = timeout
+
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = USER_AGENT
+        self._lock = threading.Lock()
+        self._host_slots: dict[str, threading.Semaphore] = {}
+        self._host_next_start: dict[str, float] = defaultdict(float)
+        self._robots: dict[str, RobotFileParser | None] = {}
+        self._robots_locks: dict[str, threading.Lock] = {}
+
+    def _get_host_slot(self, host: str) -> threading.Semaphore:
+        """Return the semaphore limiting concurrent requests to a host."""
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def _get_robots(self, url: str) -> RobotFileParser | None:
+        """Fetch and cache robots.txt for the URL's host (None if unavailable)."""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            origin_lock = self._robots_locks.setdefault(origin, threading.Lock())
+
+        # One fetch per origin: other threads wait here for the first one to finish
+        with origin_lock:
+            with self._lock:
+                if origin in self._robots:
+                    return self._robots[origin]
+
+            parser: RobotFileParser | None = RobotFileParser()
+            try:
+                response = self._session.get(f"{origin}/robots.txt", timeout=self.timeout)
+                if response.ok:
+                    parser.parse(response.text.splitlines())
+                else:
+                    parser = None
+            except requests.RequestException:
+                parser = None
+
+            with self._lock:
+                self._robots[origin] = parser
+            return parser
+
+    def _wait_turn(self, host: str, delay: float) -> None:
+        """Sleep until this host's politeness delay has elapsed."""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._host_next_start[host])
+            self._host_next_start[host] = start_at + delay
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def fetch(self, url: str) -> str | None:
+        """Fetch a single page, respecting robots.txt and per-host limits.
+
+        Returns:
+            Page HTML, or None if disallowed or the request failed.
+        """
+        robots = self._get_robots(url)
+        if robots is not None and not robots.can_fetch(USER_AGENT, url):
+            print(f"  Skipping (robots.txt): {url}")
+            return None
+
+        delay = self.delay
+        if robots is not None:
+            delay = max(delay, float(robots.crawl_delay(USER_AGENT) or 0))
+
+        host = urlparse(url).netloc
+        with self._get_host_slot(host):
+            self._wait_turn(host, delay)
+            try:
+                response = self._session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                print(f"  Failed to fetch {url}: {e}")
+                return None
+        return response.text
+
+    def crawl(
+        self, seeds: list[str], extract_links: LinkExtractor | None = None
+    ) -> dict[str, str]:
+        """Fetch seed URLs (and optionally their links) concurrently.
+
+        Args:
+            seeds: URLs to fetch at depth 0.
+            extract_links: Optional callback returning links to follow from a page.
+
+        Returns:
+            Mapping of normalized URL to HTML for every page fetched successfully.
+        """
+        pages: dict[str, str] = {}
+        seen: set[str] = set()
+        level = list(dict.fromkeys(normalize_url(seed) for seed in seeds))
+        seen.update(level)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for depth in range(self.max_depth + 1):
+                if not level:
+                    break
+                results = dict(zip(level, executor.map(self.fetch, level)))
+                next_level: list[str] = []
+                for url, html in results.items():
+                    if html is None:
+                        continue
+                    pages[url] = html
+                    if extract_links is None or depth == self.max_depth:
+                        continue
+                    for link in extract_links(url, html):
+                        link = normalize_url(urljoin(url, link))
+                        if link not in seen:
+                            seen.add(link)
+                            next_level.append(link)
+                level = next_level
+
+        return pages
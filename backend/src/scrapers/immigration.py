@@ -1,15 +1,28 @@
 """Immigration news scraper for Gov.uk."""
 
 from dataclasses import dataclass
+from datetime import datetime
+from urllib.parse import urldefrag, urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from src.db import get_client
+from src.scrapers.crawler import Crawler, normalize_url
 
 GOV_UK_IMMIGRATION_URL = "https://www.gov.uk/guidance/immigration-rules"
 CATEGORY = "immigration"
 
+# Section pages live under the index path (e.g. /guidance/immigration-rules/immigration-rules-part-1)
+SECTION_PATH_PREFIX = urlparse(GOV_UK_IMMIGRATION_URL).path + "/"
+
+# Limit on contents entries and on linked section pages
+MAX_SECTIONS = 5
+
+# Maximum length of a summary extracted from a page
+MAX_SUMMARY_LENGTH = 300
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
 
 @dataclass
 class NewsItem:
@@ -20,15 +33,118 @@ class NewsItem:
     summary: str | None = None
 
 
-def fetch_page(url: str) -> str:
-    """Fetch HTML content from a URL."""
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    return response.text
+def shorten_summary(text: str) -> str:
+    """Truncate text to MAX_SUMMARY_LENGTH characters."""
+    if len(text) > MAX_SUMMARY_LENGTH:
+        return text[: MAX_SUMMARY_LENGTH - 1].rstrip() + "…"
+    return text
+
+
+def format_change_date(value: str) -> str:
+    """Format an ISO timestamp as 'DD Mon YYYY', or return it unchanged."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%d %b %Y")
+    except (ValueError, TypeError):
+        return value
+
+
+def get_anchor_id(href: str) -> str | None:
+    """Return the fragment if href points into the index page itself, else None."""
+    url, fragment = urldefrag(urljoin(GOV_UK_IMMIGRATION_URL, href))
+    if fragment and url == normalize_url(GOV_UK_IMMIGRATION_URL):
+        return fragment
+    return None
+
+
+def parse_heading_section(soup: BeautifulSoup, anchor_id: str) -> str | None:
+    """Summarize the text under the heading an in-page anchor points to.
+
+    Collects sibling content after the heading until the next heading of the
+    same or a higher level.
+    """
+    heading = soup.find(id=anchor_id)
+    if not isinstance(heading, Tag):
+        return None
+
+    level = HEADING_TAGS.index(heading.name) if heading.name in HEADING_TAGS else 1
+    parts: list[str] = []
+    for sibling in heading.find_next_siblings():
+        if sibling.name in HEADING_TAGS and HEADING_TAGS.index(sibling.name) <= level:
+            break
+        text = sibling.get_text(" ", strip=True)
+        if text:
+            parts.append(text)
+        if sum(len(part) for part in parts) >= MAX_SUMMARY_LENGTH:
+            break
+
+    return shorten_summary(" ".join(parts)) if parts else None
+
+
+def parse_update_history(soup: BeautifulSoup, anchor_id: str) -> str | None:
+    """Summarize the change dates in the index page's update-history block.
+
+    Returns:
+        Summary like 'Updated 12 Mar 2025: <note> Earlier updates: ...', or None.
+    """
+    block = soup.find(id=anchor_id) or soup.find(class_="app-c-published-dates__change-history")
+    if not isinstance(block, Tag):
+        return None
+
+    entries = block.find_all("li")
+    if not entries:
+        next_list = block.find_next(["ol", "ul"])
+        entries = next_list.find_all("li") if next_list else []
+
+    changes: list[tuple[str, str]] = []
+    for entry in entries:
+        time_elem = entry.find("time")
+        if time_elem is None:
+            continue
+        date = format_change_date(time_elem.get("datetime") or time_elem.get_text(strip=True))
+        time_elem.extract()
+        note = entry.get_text(" ", strip=True).lstrip(":-– ").strip()
+        changes.append((date, note))
+
+    if not changes:
+        return None
+
+    latest_date, latest_note = changes[0]
+    summary = f"Updated {latest_date}: {latest_note}" if latest_note else f"Updated {latest_date}."
+    earlier = [date for date, _ in changes[1:4]]
+    if earlier:
+        summary += f" Earlier updates: {', '.join(earlier)}."
+    return shorten_summary(summary)
+
+
+def find_section_links(soup: BeautifulSoup) -> list[tuple[str, str]]:
+    """Find links to the separate section pages in the index page body.
+
+    Returns:
+        Up to MAX_SECTIONS (title, url) pairs, deduplicated by URL.
+    """
+    body = soup.find("div", class_="govspeak") or soup
+    sections: dict[str, str] = {}
+    for link in body.find_all("a", href=True):
+        url = normalize_url(urljoin(GOV_UK_IMMIGRATION_URL, link["href"]))
+        title = link.get_text(strip=True)
+        parsed = urlparse(url)
+        if parsed.netloc != urlparse(GOV_UK_IMMIGRATION_URL).netloc:
+            continue
+        if not parsed.path.startswith(SECTION_PATH_PREFIX) or not title:
+            continue
+        sections.setdefault(url, title)
+        if len(sections) >= MAX_SECTIONS:
+            break
+    return [(title, url) for url, title in sections.items()]
 
 
 def parse_immigration_updates(html: str) -> list[NewsItem]:
-    """Parse the Gov.uk immigration rules page for updates."""
+    """Parse the Gov.uk immigration rules page for updates.
+
+    In-page items (contents entries, update history) get their summaries from
+    the index page itself. Linked section pages are returned with summary=None
+    and filled in by crawl_immigration_updates.
+    """
     soup = BeautifulSoup(html, "html.parser")
     items: list[NewsItem] = []
 
@@ -46,35 +162,110 @@ def parse_immigration_updates(html: str) -> list[NewsItem]:
                 )
             )
 
-    # Look for full change history link
+    # Look for full change history link (an in-page anchor on Gov.uk)
     history_link = soup.find("a", href=lambda x: x and "full-publication-update-history" in str(x))
     if history_link:
-        history_url = history_link.get("href", "")
-        if history_url.startswith("/"):
-            history_url = f"https://www.gov.uk{history_url}"
+        href = history_link.get("href", "")
+        anchor_id = get_anchor_id(href)
+        history_summary = parse_update_history(soup, anchor_id) if anchor_id else None
         items.append(
             NewsItem(
                 title="Immigration Rules - Full Update History",
-                url=history_url,
-                summary="View the complete history of changes to immigration rules.",
+                url=urljoin(GOV_UK_IMMIGRATION_URL, href),
+                summary=history_summary
+                or "View the complete history of changes to immigration rules.",
             )
         )
 
     # Parse main content sections (parts of the guidance)
     nav_links = soup.find_all("a", class_="gem-c-contents-list__link")
-    for link in nav_links[:5]:  # Limit to first 5 sections
+    for link in nav_links[:MAX_SECTIONS]:
         href = link.get("href", "")
         title = link.get_text(strip=True)
         if href and title:
-            full_url = href if href.startswith("http") else f"https://www.gov.uk{href}"
+            anchor_id = get_anchor_id(href)
             items.append(
                 NewsItem(
                     title=f"Immigration Rules: {title}",
-                    url=full_url,
-                    summary=None,
+                    url=urljoin(GOV_UK_IMMIGRATION_URL, href),
+                    summary=parse_heading_section(soup, anchor_id) if anchor_id else None,
                 )
             )
 
+    # Linked section pages in the body (fetched separately)
+    known_urls = {item.url for item in items}
+    for title, url in find_section_links(soup):
+        if url not in known_urls:
+            items.append(NewsItem(title=f"Immigration Rules: {title}", url=url, summary=None))
+
+    return items
+
+
+def extract_section_links(page_url: str, html: str) -> list[str]:
+    """Return the section page URLs linked from the index page body."""
+    return [url for _, url in find_section_links(BeautifulSoup(html, "html.parser"))]
+
+
+def parse_section_page(html: str) -> str | None:
+    """Extract a summary and last-change date from a Gov.uk guidance page.
+
+    Returns:
+        Summary like 'Updated 02 Dec 2025: <description>', or None if nothing found.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    description = ""
+    meta_description = soup.find("meta", attrs={"name": "description"})
+    if meta_description and meta_description.get("content"):
+        description = meta_description["content"].strip()
+    else:
+        body = soup.find("div", class_="govspeak")
+        first_paragraph = body.find("p") if body else None
+        if first_paragraph:
+            description = first_paragraph.get_text(" ", strip=True)
+    description = shorten_summary(description)
+
+    # public-updated-at is the public change date; updated-at also moves on
+    # minor and technical republishes
+    changed = ""
+    for meta_name in ("govuk:public-updated-at", "govuk:updated-at"):
+        meta_updated = soup.find("meta", attrs={"name": meta_name})
+        if meta_updated and meta_updated.get("content"):
+            changed = format_change_date(meta_updated["content"])
+            break
+
+    if changed and description:
+        return f"Updated {changed}: {description}"
+    if changed:
+        return f"Last updated: {changed}"
+    return description or None
+
+
+def crawl_immigration_updates() -> list[NewsItem]:
+    """Fetch the index page, then its linked section pages in parallel.
+
+    Returns:
+        News items with summaries from the index page (in-page sections,
+        update history) or from each fetched section page.
+    """
+    crawler = Crawler(max_depth=1)
+    pages = crawler.crawl([GOV_UK_IMMIGRATION_URL], extract_links=extract_section_links)
+
+    index_url = normalize_url(GOV_UK_IMMIGRATION_URL)
+    index_html = pages.get(index_url)
+    if index_html is None:
+        raise RuntimeError(f"Could not fetch {GOV_UK_IMMIGRATION_URL}")
+
+    items = parse_immigration_updates(index_html)
+    for item in items:
+        page_url = normalize_url(item.url)
+        page_html = pages.get(page_url)
+        if page_html is None or page_url == index_url:
+            continue
+        summary = parse_section_page(page_html)
+        if summary:
+            item.summary = summary
+
     return items
 
 
@@ -89,8 +280,7 @@ def scrape_and_save() -> int:
     """
     print(f"Scraping: {GOV_UK_IMMIGRATION_URL}")
 
-    html = fetch_page(GOV_UK_IMMIGRATION_URL)
-    items = parse_immigration_updates(html)
+    items = crawl_immigration_updates()
 
     if not items:
         print("No items found to scrape.")
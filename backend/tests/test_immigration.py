@@ -0,0 +1,90 @@
+"""Tests for the Gov.uk immigration scraper parsing and crawl."""
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.scrapers import immigration
+from src.scrapers.immigration import (
+    GOV_UK_IMMIGRATION_URL,
+    crawl_immigration_updates,
+    extract_section_links,
+    parse_immigration_updates,
+    parse_section_page,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+INDEX_HTML = (FIXTURES / "immigration_index.html").read_text()
+SECTION_HTML = (FIXTURES / "immigration_section.html").read_text()
+
+PART_1_URL = (
+    "https://www.gov.uk/guidance/immigration-rules/"
+    "immigration-rules-part-1-leave-to-enter-or-stay-in-the-uk"
+)
+SKILLED_WORKER_URL = (
+    "https://www.gov.uk/guidance/immigration-rules/immigration-rules-appendix-skilled-worker"
+)
+
+
+class ParseImmigrationUpdatesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.items = {item.url: item for item in parse_immigration_updates(INDEX_HTML)}
+
+    def test_contents_anchor_summary_comes_from_heading_section(self) -> None:
+        item = self.items[f"{GOV_UK_IMMIGRATION_URL}#introduction"]
+        self.assertEqual(item.title, "Immigration Rules: Introduction")
+        self.assertTrue(item.summary.startswith("The Immigration Rules set out who can come"))
+        # Subheadings belong to the section; the next h2 ends it
+        self.assertIn("Statements of changes", item.summary)
+        self.assertNotIn("split into parts", item.summary)
+
+    def test_history_summary_lists_change_dates(self) -> None:
+        item = self.items[f"{GOV_UK_IMMIGRATION_URL}#full-publication-update-history"]
+        self.assertEqual(
+            item.summary,
+            "Updated 12 Mar 2025: Updated with changes from HC 733. "
+            "Earlier updates: 08 Jan 2025.",
+        )
+
+    def test_section_pages_are_listed_without_summary(self) -> None:
+        self.assertIsNone(self.items[PART_1_URL].summary)
+        self.assertIsNone(self.items[SKILLED_WORKER_URL].summary)
+
+
+class ExtractSectionLinksTest(unittest.TestCase):
+    def test_only_deduplicated_section_pages_are_followed(self) -> None:
+        links = extract_section_links(GOV_UK_IMMIGRATION_URL, INDEX_HTML)
+        self.assertEqual(links, [PART_1_URL, SKILLED_WORKER_URL])
+
+
+class ParseSectionPageTest(unittest.TestCase):
+    def test_prefers_public_change_date(self) -> None:
+        self.assertEqual(
+            parse_section_page(SECTION_HTML),
+            "Updated 12 Mar 2025: Rules on leave to enter or remain in the UK.",
+        )
+
+
+class CrawlImmigrationUpdatesTest(unittest.TestCase):
+    def test_section_summaries_come_from_fetched_pages(self) -> None:
+        pages = {
+            GOV_UK_IMMIGRATION_URL: INDEX_HTML,
+            PART_1_URL: SECTION_HTML,
+        }
+        with mock.patch.object(immigration, "Crawler") as crawler_cls:
+            crawler_cls.return_value.crawl.return_value = pages
+            items = {item.url: item for item in crawl_immigration_updates()}
+
+        crawler_cls.return_value.crawl.assert_called_once_with(
+            [GOV_UK_IMMIGRATION_URL], extract_links=extract_section_links
+        )
+        self.assertEqual(
+            items[PART_1_URL].summary,
+            "Updated 12 Mar 2025: Rules on leave to enter or remain in the UK.",
+        )
+        # Failed fetches keep summary=None rather than failing the scrape
+        self.assertIsNone(items[SKILLED_WORKER_URL].summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
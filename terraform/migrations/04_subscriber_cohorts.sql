@@ -0,0 +1,58 @@
+-- Migration: Server-side subscriber-to-news matching for the daily brief
+-- Run this in Supabase SQL Editor after 03_rls_policies
+
+-- Supports the containment match below (preferences_json @> '{"tech": true}')
+-- for active subscribers only
+CREATE INDEX idx_subscribers_active_preferences ON subscribers
+  USING GIN (preferences_json jsonb_path_ops)
+  WHERE is_active;
+
+-- Lets the "categories with news today" lookup read the index alone.
+-- It also serves every scraped_at query, so the single-column index is dropped.
+CREATE INDEX idx_news_items_scraped_at_category ON news_items(scraped_at, category);
+DROP INDEX IF EXISTS idx_news_items_scraped_at;
+
+-- Returns one row per cohort: the categories that have news since `since` and
+-- that every subscriber in the cohort has enabled, plus those subscribers.
+-- Subscribers with no matching category are not returned at all.
+-- Cohorts are keyed by the matched categories (enabled set ∩ today's categories),
+-- which is exactly what determines the digest each subscriber receives.
+CREATE OR REPLACE FUNCTION get_daily_brief_cohorts(since TIMESTAMPTZ)
+RETURNS TABLE (categories TEXT[], subscribers JSONB)
+LANGUAGE sql
+STABLE
+AS $$
+  WITH todays_categories AS (
+    SELECT DISTINCT lower(n.category) AS category
+    FROM news_items n
+    WHERE n.scraped_at >= since
+  ),
+  matched AS (
+    SELECT
+      s.id,
+      s.email,
+      s.management_token,
+      array_agg(c.category ORDER BY c.category) AS categories
+    FROM subscribers s
+    JOIN todays_categories c
+      ON s.preferences_json @> jsonb_build_object(c.category, true)
+    WHERE s.is_active
+    GROUP BY s.id, s.email, s.management_token
+  )
+  SELECT
+    m.categories,
+    jsonb_agg(
+      jsonb_build_object(
+        'id', m.id,
+        'email', m.email,
+        'management_token', m.management_token
+      )
+      ORDER BY m.email
+    ) AS subscribers
+  FROM matched m
+  GROUP BY m.categories;
+$$;
+
+-- Only the backend (service role) calls this function
+REVOKE EXECUTE ON FUNCTION get_daily_brief_cohorts(TIMESTAMPTZ) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_daily_brief_cohorts(TIMESTAMPTZ) TO service_role;
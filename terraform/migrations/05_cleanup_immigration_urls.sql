@@ -0,0 +1,11 @@
+-- Migration: Remove immigration rows stored under malformed anchor URLs
+-- Run this in Supabase SQL Editor once, before the next scrape
+
+-- The immigration scraper used to build in-page anchor links as
+-- "https://www.gov.uk#<anchor>" (contents entries) or leave them as
+-- "#<anchor>" (update history). It now stores them on the index page URL,
+-- e.g. "https://www.gov.uk/guidance/immigration-rules#<anchor>". URL is the
+-- upsert key, so the old rows would otherwise remain as duplicates.
+DELETE FROM news_items
+WHERE category = 'immigration'
+  AND (url LIKE 'https://www.gov.uk#%' OR url LIKE '#%');